@@ -30,7 +30,14 @@ from homeassistant.const import (
     STATE_UNKNOWN,
 )
 from homeassistant.components import persistent_notification
-from homeassistant.core import CoreState, HomeAssistant, callback
+from homeassistant.core import (
+    CoreState,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import (
     convert_include_exclude_filter,
@@ -40,7 +47,7 @@ from homeassistant.helpers.typing import ConfigType
 import homeassistant.util.dt as dt_util
 from homeassistant.helpers.json import JSONEncoder
 
-from .models import Base, LTSS
+from .models import Base, LTSS, LTSSLatest, StateRecord
 from .migrations import check_and_migrate
 
 _LOGGER = logging.getLogger(__name__)
@@ -52,6 +59,14 @@ CONF_CHUNK_TIME_INTERVAL = "chunk_time_interval"
 
 CONNECT_RETRY_WAIT = 3
 
+SERVICE_CURRENT_VALUES = "current_values"
+
+CURRENT_VALUES_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTITY_ID): cv.entity_ids,
+    }
+)
+
 CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
@@ -84,7 +99,23 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     instance.async_initialize()
     instance.start()
 
-    return await instance.async_db_ready
+    if not await instance.async_db_ready:
+        return False
+
+    @callback
+    def current_values(call: ServiceCall) -> ServiceResponse:
+        """Return the latest recorded values from the in-memory cache."""
+        return instance.current_values(call.data.get(ATTR_ENTITY_ID))
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CURRENT_VALUES,
+        current_values,
+        schema=CURRENT_VALUES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    return True
 
 
 class LTSS_DB(threading.Thread):
@@ -113,6 +144,9 @@ class LTSS_DB(threading.Thread):
 
         self.get_session = None
 
+        self.latest: Dict[str, Dict[str, Any]] = {}
+        self.latest_lock = threading.Lock()
+
     @callback
     def async_initialize(self):
         """Initialize the ltss."""
@@ -191,9 +225,9 @@ class LTSS_DB(threading.Thread):
             return
 
         while True:
-            event = self.queue.get()
+            record = self.queue.get()
 
-            if event is None:
+            if record is None:
                 self._close_connection()
                 self.queue.task_done()
                 return
@@ -204,18 +238,8 @@ class LTSS_DB(threading.Thread):
                 if tries != 1:
                     time.sleep(CONNECT_RETRY_WAIT)
                 try:
-                    with self.get_session() as session:
-                        with session.begin():
-                            try:
-                                row = LTSS.from_event(event)
-                                session.add(row)
-                            except (TypeError, ValueError):
-                                _LOGGER.warning(
-                                    "State is not JSON serializable: %s",
-                                    event.data.get("new_state"),
-                                )
-
-                        updated = True
+                    self._save_record(record)
+                    updated = True
 
                 except exc.OperationalError as err:
                     _LOGGER.error(
@@ -228,11 +252,11 @@ class LTSS_DB(threading.Thread):
 
                 except exc.SQLAlchemyError:
                     updated = True
-                    _LOGGER.exception("Error saving event: %s", event)
+                    _LOGGER.exception("Error saving event: %s", record)
 
                 except Exception:
                     updated = True
-                    _LOGGER.exception("Error during saving of event: %s", event)
+                    _LOGGER.exception("Error during saving of event: %s", record)
 
             if not updated:
                 _LOGGER.error(
@@ -245,14 +269,62 @@ class LTSS_DB(threading.Thread):
 
     @callback
     def event_listener(self, event):
-        """Listen for new events and put them in the process queue."""
+        """Listen for new events and put compact records of them in the process queue."""
         # Filer on entity_id
         entity_id = event.data.get(ATTR_ENTITY_ID)
         state = event.data.get("new_state")
 
         if entity_id is not None and state is not None and state.state != STATE_UNKNOWN:
             if self.entity_filter(entity_id):
-                self.queue.put(event)
+                self.queue.put(StateRecord.from_event(event))
+
+    def _save_record(self, record):
+        """Save a record and the latest state of its entity, then update the cache."""
+        latest = None
+        with self.get_session() as session:
+            with session.begin():
+                try:
+                    row = LTSS.from_record(record)
+                    session.add(row)
+                    session.execute(LTSSLatest.upsert_from_row(row))
+                    latest = (row.entity_id, row.time, row.state, row.attributes)
+                except (TypeError, ValueError):
+                    _LOGGER.warning("State is not JSON serializable: %s", record)
+
+        if latest is not None:
+            self._update_latest(*latest)
+
+    def _update_latest(self, entity_id, time_, state, attributes):
+        """Update the in-memory last-value cache, ignoring out-of-order values."""
+        # Normalise here, on the LTSS thread, to match what is read back from the database
+        value = {
+            "time": dt_util.as_utc(time_).isoformat(),
+            "state": state,
+            "attributes": json.loads(json.dumps(attributes, cls=JSONEncoder)),
+        }
+
+        with self.latest_lock:
+            current = self.latest.get(entity_id)
+            if current is None or current[0] <= time_:
+                self.latest[entity_id] = (time_, value)
+
+    def _load_latest(self):
+        """Warm up the in-memory last-value cache from the latest state table."""
+        with self.get_session() as session:
+            for row in session.query(LTSSLatest):
+                self._update_latest(row.entity_id, row.time, row.state, row.attributes)
+
+    def current_values(self, entity_ids=None):
+        """Return the latest recorded values, optionally limited to some entities."""
+        with self.latest_lock:
+            if entity_ids is None:
+                entity_ids = self.latest.keys()
+
+            return {
+                entity_id: dict(self.latest[entity_id][1])
+                for entity_id in entity_ids
+                if entity_id in self.latest
+            }
 
     def _setup_connection(self):
         """Ensure database is ready to fly."""
@@ -312,6 +384,8 @@ class LTSS_DB(threading.Thread):
 
         self.get_session = scoped_session(sessionmaker(bind=self.engine))
 
+        self._load_latest()
+
     def _create_table(self, available_extensions):
         _LOGGER.info("Creating LTSS table")
         with self.engine.connect() as con:
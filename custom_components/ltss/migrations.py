@@ -2,7 +2,12 @@ import logging
 
 from sqlalchemy import inspect, text, Text
 
-from .models import LTSS, LTSS_attributes_index, LTSS_entityid_time_composite_index
+from .models import (
+    LTSS,
+    LTSSLatest,
+    LTSS_attributes_index,
+    LTSS_entityid_time_composite_index,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -53,6 +58,13 @@ def check_and_migrate(engine):
         )
         remove_id_column(engine)
 
+    # Latest state table?
+    if not iengine.has_table(LTSSLatest.__tablename__):
+        _LOGGER.warning(
+            "Creating and populating the latest state table, this might take a couple of minutes!"
+        )
+        create_latest_table(engine)
+
 
 def migrate_attributes_text_to_jsonb(engine):
     with engine.connect() as con:
@@ -101,3 +113,18 @@ def remove_id_column(engine):
         )
         con.commit()
     _LOGGER.info("Migration completed successfully!")
+
+
+def create_latest_table(engine):
+    # create and populate in one transaction, a partial migration is rolled back entirely
+    with engine.begin() as con:
+        LTSSLatest.__table__.create(bind=con)
+        con.execute(
+            text(
+                f"""INSERT INTO {LTSSLatest.__tablename__} (entity_id, time, state, attributes)
+                    SELECT DISTINCT ON (entity_id) entity_id, time, state, attributes
+                    FROM {LTSS.__tablename__}
+                    ORDER BY entity_id, time DESC"""
+            )
+        )
+    _LOGGER.info("Latest state table created successfully!")
@@ -13,7 +13,7 @@ from sqlalchemy import (
 )
 
 from sqlalchemy.schema import Index
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import JSONB, insert
 from geoalchemy2 import Geometry
 from sqlalchemy.orm import column_property, declarative_base
 
@@ -24,6 +24,35 @@ Base = declarative_base()
 _LOGGER = logging.getLogger(__name__)
 
 
+class StateRecord:
+    """Compact snapshot of a state_changed event, queued for the LTSS thread."""
+
+    __slots__ = ("time", "entity_id", "state", "attributes")
+
+    def __init__(self, time, entity_id, state, attributes):
+        """Initialize the record."""
+        self.time = time
+        self.entity_id = entity_id
+        self.state = state
+        self.attributes = attributes
+
+    @classmethod
+    def from_event(cls, event):
+        """Create record from a state_changed event."""
+        state = event.data.get("new_state")
+
+        return cls(
+            time=event.time_fired,
+            entity_id=event.data["entity_id"],
+            state=state.state.replace("\x00", "\uFFFD"),
+            attributes=dict(state.attributes),
+        )
+
+    def __repr__(self):
+        """Return the representation."""
+        return f"<StateRecord {self.entity_id}={self.state} @ {self.time.isoformat()} attributes={self.attributes!r}>"
+
+
 class LTSS(Base):  # type: ignore
     """State change history."""
 
@@ -46,10 +75,12 @@ class LTSS(Base):  # type: ignore
     @classmethod
     def from_event(cls, event):
         """Create object from a state_changed event."""
-        entity_id = event.data["entity_id"]
-        state = event.data.get("new_state")
+        return cls.from_record(StateRecord.from_event(event))
 
-        attrs = dict(state.attributes)
+    @classmethod
+    def from_record(cls, record):
+        """Create object from a queued state record, leaving the record untouched."""
+        attrs = dict(record.attributes)
 
         location = None
 
@@ -62,9 +93,9 @@ class LTSS(Base):  # type: ignore
             location = f"SRID=4326;POINT({lon} {lat})" if lon and lat else None
 
         row = LTSS(
-            entity_id=entity_id,
-            time=event.time_fired,
-            state=state.state.replace("\x00", "\uFFFD"),
+            entity_id=record.entity_id,
+            time=record.time,
+            state=record.state,
             attributes=attrs,
             location=location,
         )
@@ -72,6 +103,35 @@ class LTSS(Base):  # type: ignore
         return row
 
 
+class LTSSLatest(Base):  # type: ignore
+    """Latest state per entity, maintained alongside the state change history."""
+
+    __tablename__ = "ltss_latest"
+    entity_id = Column(String(255), primary_key=True)
+    time = Column(DateTime(timezone=True), nullable=False)
+    state = Column(String(255))
+    attributes = Column(JSONB)
+
+    @classmethod
+    def upsert_from_row(cls, row):
+        """Create an upsert statement mirroring a LTSS row, never moving backwards in time."""
+        stmt = insert(cls).values(
+            entity_id=row.entity_id,
+            time=row.time,
+            state=row.state,
+            attributes=row.attributes,
+        )
+        return stmt.on_conflict_do_update(
+            index_elements=[cls.entity_id],
+            set_={
+                "time": stmt.excluded.time,
+                "state": stmt.excluded.state,
+                "attributes": stmt.excluded.attributes,
+            },
+            where=cls.time <= stmt.excluded.time,
+        )
+
+
 LTSS_attributes_index = Index(
     "ltss_attributes_idx", LTSS.attributes, postgresql_using="gin"
 )
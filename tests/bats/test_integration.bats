@@ -188,6 +188,7 @@ teardown() {
 
     # Secondly, lets check that LTSS was setup as expected
     assert_line --partial "We found a custom integration ltss which has not been tested by Home Assistant."
+    assert_line --partial "Latest state table created successfully!"
     assert_line --partial "Setup of domain ltss took"
     refute_line --partial "ERROR (LTSS)"
 }
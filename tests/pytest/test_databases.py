@@ -1,11 +1,13 @@
 import time
+from datetime import datetime, timedelta, timezone
 from time import sleep
 
 import docker as docker
 import pytest
 from sqlalchemy import text
 
-from custom_components.ltss import LTSS_DB, LTSS
+from custom_components.ltss import LTSS_DB, LTSS, LTSSLatest, StateRecord
+from custom_components.ltss.migrations import check_and_migrate
 
 
 class TestDBSetup:
@@ -64,6 +66,39 @@ class TestDBSetup:
             with ltss.engine.connect() as con:
                 assert self._has_columns(con)
                 assert not self._has_location_column(con)
+                assert self._has_latest_table(con)
+
+            self._check_latest(ltss)
+        finally:
+            container.stop()
+
+    def test_latest_migration(self):
+        container = self.db_container("postgres:latest")
+
+        try:
+            ltss = self.ltss_init_wrapper(container)
+            ltss._setup_connection()
+
+            now = datetime.now(timezone.utc)
+            with ltss.engine.begin() as con:
+                con.execute(text(f"DROP TABLE {LTSSLatest.__tablename__}"))
+                con.execute(
+                    text(
+                        f"INSERT INTO {LTSS.__tablename__} (time, entity_id, state)\
+        VALUES (:older, 'sensor.a', 'older'), (:newer, 'sensor.a', 'newer'),\
+        (:older, 'sensor.b', 'only')"
+                    ),
+                    {"older": now - timedelta(minutes=1), "newer": now},
+                )
+
+            check_and_migrate(ltss.engine)
+
+            with ltss.engine.connect() as con:
+                assert {("sensor.a", "newer"), ("sensor.b", "only")} == set(
+                    con.execute(
+                        text(f"SELECT entity_id, state FROM {LTSSLatest.__tablename__}")
+                    ).all()
+                )
         finally:
             container.stop()
 
@@ -87,6 +122,9 @@ class TestDBSetup:
             with ltss.engine.connect() as con:
                 assert self._is_hypertable(con)
                 assert self._has_columns(con)
+                assert self._has_latest_table(con)
+
+            self._check_latest(ltss)
         finally:
             container.stop()
 
@@ -105,6 +143,73 @@ class TestDBSetup:
         finally:
             container.stop()
 
+    @staticmethod
+    def _check_latest(ltss):
+        newer = LTSS(
+            entity_id="sensor.test",
+            time=datetime.now(timezone.utc),
+            state="newer",
+            attributes={"unit_of_measurement": "°C"},
+        )
+        older = LTSS(
+            entity_id="sensor.test",
+            time=newer.time - timedelta(minutes=1),
+            state="older",
+            attributes={},
+        )
+
+        with ltss.engine.begin() as con:
+            con.execute(LTSSLatest.upsert_from_row(newer))
+            con.execute(LTSSLatest.upsert_from_row(older))
+
+        with ltss.engine.connect() as con:
+            assert (
+                "newer"
+                == con.execute(
+                    text(
+                        f"SELECT state FROM {LTSSLatest.__tablename__}\
+        WHERE entity_id = 'sensor.test'"
+                    )
+                ).scalar()
+            )
+
+        ltss._load_latest()
+        assert {
+            "time": newer.time.isoformat(),
+            "state": "newer",
+            "attributes": {"unit_of_measurement": "°C"},
+        } == ltss.current_values(["sensor.test"])["sensor.test"]
+
+        # the same path as the LTSS thread, in reversed order
+        ltss._save_record(
+            StateRecord(newer.time, "sensor.saved", "newer", {"battery": 80})
+        )
+        ltss._save_record(
+            StateRecord(older.time, "sensor.saved", "older", {"battery": 81})
+        )
+
+        with ltss.engine.connect() as con:
+            assert (
+                2
+                == con.execute(
+                    text(
+                        f"SELECT * FROM {LTSS.__tablename__}\
+        WHERE entity_id = 'sensor.saved'"
+                    )
+                ).rowcount
+            )
+            assert (
+                "newer"
+                == con.execute(
+                    text(
+                        f"SELECT state FROM {LTSSLatest.__tablename__}\
+        WHERE entity_id = 'sensor.saved'"
+                    )
+                ).scalar()
+            )
+
+        assert "newer" == ltss.current_values(["sensor.saved"])["sensor.saved"]["state"]
+
     @staticmethod
     def _is_hypertable(con):
         timescaledb_version = con.execute(
@@ -151,3 +256,16 @@ class TestDBSetup:
                 )
             ).rowcount
         )
+
+    @staticmethod
+    def _has_latest_table(con):
+        return (
+            1
+            == con.execute(
+                text(
+                    f"SELECT *\
+        FROM information_schema.tables\
+        WHERE table_name = '{LTSSLatest.__tablename__}'"
+                )
+            ).rowcount
+        )
@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from custom_components.ltss import LTSS_DB
+
+
+class TestLatestCache:
+    NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    @pytest.fixture
+    def ltss(self):
+        # no connection is made, the cache lives entirely in memory
+        ltss = LTSS_DB(None, "postgresql://localhost", 123, lambda x: True)
+        ltss._update_latest("sensor.a", self.NOW, "1", {"unit": "°C"})
+        ltss._update_latest(
+            "sensor.b", self.NOW, "2", {"last_reset": self.NOW, "options": ("x",)}
+        )
+        return ltss
+
+    def test_response_shape(self, ltss):
+        assert {
+            "sensor.a": {
+                "time": "2024-01-01T00:00:00+00:00",
+                "state": "1",
+                "attributes": {"unit": "°C"},
+            },
+            "sensor.b": {
+                "time": "2024-01-01T00:00:00+00:00",
+                "state": "2",
+                "attributes": {
+                    "last_reset": "2024-01-01T00:00:00+00:00",
+                    "options": ["x"],
+                },
+            },
+        } == ltss.current_values()
+
+    def test_entity_filtering(self, ltss):
+        assert ["sensor.a"] == list(ltss.current_values(["sensor.a"]))
+
+    def test_unknown_entities_skipped(self, ltss):
+        assert ["sensor.b"] == list(ltss.current_values(["sensor.unknown", "sensor.b"]))
+        assert {} == ltss.current_values(["sensor.unknown"])
+
+    def test_out_of_order_ignored(self, ltss):
+        ltss._update_latest("sensor.a", self.NOW - timedelta(seconds=1), "0", {})
+        assert "1" == ltss.current_values(["sensor.a"])["sensor.a"]["state"]
+
+        ltss._update_latest("sensor.a", self.NOW + timedelta(seconds=1), "3", {})
+        assert "3" == ltss.current_values(["sensor.a"])["sensor.a"]["state"]
+
+    def test_response_is_a_copy(self, ltss):
+        ltss.current_values()["sensor.a"]["state"] = "changed"
+
+        assert "1" == ltss.current_values()["sensor.a"]["state"]
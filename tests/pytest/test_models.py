@@ -0,0 +1,74 @@
+from datetime import datetime, timezone
+
+import pytest
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, State
+
+from custom_components.ltss import LTSS, StateRecord
+
+
+class TestStateRecord:
+    @staticmethod
+    def state_changed_event(state, attributes):
+        return Event(
+            EVENT_STATE_CHANGED,
+            {
+                "entity_id": "device_tracker.phone",
+                "new_state": State("device_tracker.phone", state, attributes),
+            },
+            time_fired_timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp(),
+        )
+
+    @pytest.fixture
+    def record(self):
+        return StateRecord.from_event(
+            self.state_changed_event(
+                "home", {"latitude": 57.7, "longitude": 11.9, "battery": 80}
+            )
+        )
+
+    @pytest.fixture
+    def location_activated(self, monkeypatch):
+        # a truthy stand-in, activate_location_extraction() would permanently alter the mapped table
+        monkeypatch.setattr(LTSS, "location", True)
+
+    def test_from_event(self, record):
+        assert "device_tracker.phone" == record.entity_id
+        assert datetime(2024, 1, 1, tzinfo=timezone.utc) == record.time
+        assert "home" == record.state
+        assert {"latitude": 57.7, "longitude": 11.9, "battery": 80} == record.attributes
+
+    def test_location_off(self, record):
+        row = LTSS.from_record(record)
+
+        assert {"latitude": 57.7, "longitude": 11.9, "battery": 80} == row.attributes
+        assert row.location is None
+
+    def test_location_off_none_coordinate(self):
+        record = StateRecord.from_event(
+            self.state_changed_event("home", {"latitude": None})
+        )
+
+        assert {"latitude": None} == LTSS.from_record(record).attributes
+
+    def test_location_on(self, record, location_activated):
+        row = LTSS.from_record(record)
+
+        assert {"battery": 80} == row.attributes
+        assert "SRID=4326;POINT(11.9 57.7)" == row.location
+
+    def test_state_sanitised(self):
+        record = StateRecord.from_event(self.state_changed_event("a\x00b", {}))
+
+        assert "a\uFFFDb" == record.state
+        assert "a\uFFFDb" == LTSS.from_record(record).state
+
+    def test_from_record_idempotent(self, record, location_activated):
+        first = LTSS.from_record(record)
+        second = LTSS.from_record(record)
+
+        assert {"latitude": 57.7, "longitude": 11.9, "battery": 80} == record.attributes
+        assert first.attributes == second.attributes
+        assert first.location == second.location
+        assert first.state == second.state
+        assert first.time == second.time